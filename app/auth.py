@@ -2,13 +2,20 @@
 MindTrack Authentication Module
 """
 
+import hashlib
+import os
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+import anyio
+from argon2 import PasswordHasher, Type, exceptions as argon2_exc
+from cachetools import TTLCache
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import exists
+from sqlalchemy.orm import Session, load_only
 from app.database import get_db
 from app.models import User
 
@@ -17,11 +24,39 @@ SECRET_KEY = "mindtrack-secret-key-change-in-production-2024"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Verified token cache: sha256(token) -> (username, user_id, expires_at)
+# Only successful decodes are cached; entries never outlive the token's own exp
+TOKEN_CACHE_TTL_SECONDS = min(30, ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+_token_cache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
+
+# Resolved once at import; exp and sub must be present on every token
+_DECODE_KWARGS = {
+    "key": SECRET_KEY,
+    "algorithms": [ALGORITHM],
+    "options": {"require_exp": True, "require_sub": True, "verify_aud": False},
+}
+
 # Password hashing
-# Use Argon2 instead of bcrypt
-pwd_context = CryptContext(
-    schemes=["argon2"],
-    deprecated="auto"
+# Use Argon2id with the OWASP profile (46 MiB, t=1, p=1) instead of library defaults
+pwd_hasher = PasswordHasher(
+    time_cost=1,
+    memory_cost=47104,
+    parallelism=1,
+    hash_len=32,
+    salt_len=16,
+    type=Type.ID
+)
+
+# Verified against for unknown usernames so every login costs one Argon2 verify
+_DUMMY_HASH = pwd_hasher.hash("invalid-placeholder-password")
+
+# Caps concurrent login Argon2 work (verify or rehash, ~46 MiB each) at one per CPU
+_argon2_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+
+# Columns routes read from the current user; the password hash is left deferred
+_CURRENT_USER_COLUMNS = load_only(
+    User.id, User.username, User.email, User.full_name, User.created_at, User.updated_at
 )
 
 # OAuth2 scheme
@@ -29,14 +64,20 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 def get_password_hash(password: str) -> str:
     """Generate a password hash without 72-byte limit"""
-    return pwd_context.hash(password)
+    return pwd_hasher.hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against a hash"""
-    return pwd_context.verify(plain_password, hashed_password)
- 
+    """Verify a password against a hash (blocking - async routes use verify_password_async)"""
+    try:
+        return pwd_hasher.verify(hashed_password, plain_password)
+    except (argon2_exc.VerificationError, argon2_exc.InvalidHashError):
+        return False
 
-    
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password from async routes without blocking the event loop"""
+    return await anyio.to_thread.run_sync(
+        verify_password, plain_password, hashed_password, limiter=_argon2_limiter
+    )
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
@@ -49,6 +90,25 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def decode_access_token(token: str) -> Tuple[str, Optional[int]]:
+    """Return (username, user_id) for a valid JWT, reusing cached verifications"""
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached is not None and cached[2] > now:
+        return cached[0], cached[1]
+
+    payload = jwt.decode(token, **_DECODE_KWARGS)
+    username: str = payload["sub"]
+    user_id: Optional[int] = payload.get("uid")
+
+    # TTLCache bounds the entry lifetime; exp stops it outliving the token
+    expires_at = payload["exp"]
+    with _token_cache_lock:
+        _token_cache[key] = (username, user_id, expires_at)
+    return username, user_id
+
 def get_current_user(
     token: str = Depends(oauth2_scheme), 
     db: Session = Depends(get_db)
@@ -60,25 +120,49 @@ def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
+        username, user_id = decode_access_token(token)
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.username == username).first()
-    if user is None:
+    # Tokens issued before the uid claim existed fall back to a username lookup
+    if user_id is not None:
+        user = db.get(User, user_id, options=[_CURRENT_USER_COLUMNS])
+    else:
+        user = db.query(User).options(_CURRENT_USER_COLUMNS).filter(User.username == username).first()
+    if user is None or user.username != username:
         raise credentials_exception
     return user
 
-def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
-    """Authenticate user with username and password"""
+def _load_password_hash(db: Session, username: str) -> Tuple[Optional[User], str]:
+    """Look up a user and its hash, then release the connection before verifying"""
     user = db.query(User).filter(User.username == username).first()
-    if not user:
-        return None
-    if not verify_password(password, user.hashed_password):
+    
+    # Closing the session detaches the already-loaded user, which stays readable
+    hashed_password = user.hashed_password if user else _DUMMY_HASH
+    db.close()
+    return user, hashed_password
+
+def _rehash_password(db: Session, user_id: int, password: str):
+    """Store a hash made with the current Argon2 parameters"""
+    db.query(User).filter(User.id == user_id).update(
+        {User.hashed_password: get_password_hash(password)}
+    )
+    db.commit()
+
+async def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
+    """Authenticate user with username and password"""
+    # Blocking DB work runs in the thread pool, off the event loop
+    user, hashed_password = await anyio.to_thread.run_sync(_load_password_hash, db, username)
+    
+    # Always verify, even for unknown users, so timing does not reveal usernames
+    if not await verify_password_async(password, hashed_password) or user is None:
         return None
+    
+    # Upgrade hashes created with older Argon2 parameters
+    if pwd_hasher.check_needs_rehash(hashed_password):
+        await anyio.to_thread.run_sync(
+            _rehash_password, db, user.id, password, limiter=_argon2_limiter
+        )
     return user
 
 def register_user(db: Session, username: str, email: str, password: str, full_name: str = None) -> User:
@@ -90,10 +174,9 @@ def register_user(db: Session, username: str, email: str, password: str, full_na
             detail="Password too long. Maximum 72 bytes allowed."
         )
 
-    # Check if user exists
-    existing_user = db.query(User).filter(
-        (User.username == username) | (User.email == email)
-    ).first()
+    # Check if user exists (two unique-index probes instead of an OR scan)
+    existing_user = db.query(exists().where(User.username == username)).scalar() or \
+                    db.query(exists().where(User.email == email)).scalar()
     
     if existing_user:
         raise HTTPException(
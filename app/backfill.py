@@ -0,0 +1,67 @@
+"""
+MindTrack Questionnaire Backfill
+
+Imports historical questionnaires for one user, outside of the API:
+    python -m app.backfill <username> <records.csv|records.json>
+
+Each record needs the QuestionnaireData fields and may carry a created_at
+timestamp (naive values are taken as UTC); records without one are stamped
+with the import time. Rows are scored in bulk and inserted with executemany,
+committing once per chunk.
+"""
+
+import argparse
+from typing import Tuple
+
+import pandas as pd
+
+from app.database import SessionLocal
+from app.models import User
+from app.routes.questionnaire import QuestionnaireData, backfill_questionnaires
+
+# Records scored and committed per transaction
+CHUNK_SIZE = 1000
+
+def load_records(path: str) -> Tuple[list, list]:
+    """Read questionnaire records and their created_at timestamps from a CSV or JSON file"""
+    if path.endswith(".csv"):
+        df = pd.read_csv(path)
+    else:
+        df = pd.read_json(path)
+    
+    # Original timestamps as naive UTC, None where missing
+    if "created_at" in df:
+        timestamps = pd.to_datetime(df.pop("created_at"), utc=True).dt.tz_convert(None)
+        created_at = [None if pd.isna(ts) else ts.to_pydatetime() for ts in timestamps]
+    else:
+        created_at = [None] * len(df)
+    
+    records = [QuestionnaireData(**record).model_dump() for record in df.to_dict("records")]
+    return records, created_at
+
+def backfill(username: str, path: str) -> int:
+    """Backfill every record in path for username; returns the number imported"""
+    records, created_at = load_records(path)
+    
+    db = SessionLocal()
+    try:
+        user_id = db.query(User.id).filter(User.username == username).scalar()
+        if user_id is None:
+            raise SystemExit(f"Unknown user: {username}")
+        
+        count = 0
+        for start in range(0, len(records), CHUNK_SIZE):
+            chunk = slice(start, start + CHUNK_SIZE)
+            count += backfill_questionnaires(db, user_id, records[chunk], created_at[chunk])
+        return count
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import historical questionnaires for a user")
+    parser.add_argument("username")
+    parser.add_argument("path", help="CSV or JSON file of questionnaire records")
+    args = parser.parse_args()
+    
+    count = backfill(args.username, args.path)
+    print(f"Imported {count} questionnaires for {args.username}")
@@ -3,7 +3,7 @@ MindTrack Database Configuration
 """
 
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -18,8 +18,16 @@ if DATABASE_URL.startswith("sqlite"):
         connect_args={"check_same_thread": False}
     )
 else:
-    # PostgreSQL on Render
-    engine = create_engine(DATABASE_URL)
+    # PostgreSQL on Render - explicit pool sized for login bursts,
+    # with stale connections detected and recycled before use
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=20,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_use_lifo=True
+    )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -35,6 +43,38 @@ def get_db():
     finally:
         db.close()
 
+# Columns switched from JSON to JSONB; tables created before the switch still hold json
+_JSONB_COLUMNS = (
+    ("user_responses", "questionnaire_data"),
+    ("predictions", "factors"),
+    ("predictions", "recommendations"),
+)
+
+def _migrate_json_to_jsonb(conn):
+    """Convert leftover PostgreSQL json columns to jsonb (no-op once converted)"""
+    for table, column in _JSONB_COLUMNS:
+        data_type = conn.execute(
+            text(
+                "SELECT data_type FROM information_schema.columns "
+                "WHERE table_schema = current_schema() AND table_name = :table AND column_name = :column"
+            ),
+            {"table": table, "column": column}
+        ).scalar()
+        if data_type == "json":
+            conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb"))
+
 def init_db():
     """Initialize database tables"""
+    # Registers every model on Base.metadata; without it create_all sees no tables
+    import app.models  # noqa: F401
+    
     Base.metadata.create_all(bind=engine)
+    
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            _migrate_json_to_jsonb(conn)
+        
+        # create_all only builds indexes with new tables; add any missing on existing ones
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
@@ -0,0 +1,15 @@
+"""
+MindTrack Database Initialization
+
+Creates all database tables once, outside of app startup:
+    python -m app.init_db
+
+Runs as the release step in procfile, so every deploy gets the schema
+before web workers start. Safe to re-run.
+"""
+
+from app.database import init_db
+
+if __name__ == "__main__":
+    init_db()
+    print("Database tables created")
@@ -5,33 +5,33 @@ FastAPI Backend Application
 
 import os
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.routes import auth, users, questionnaire, predictions, statistics
-from app.database import engine, Base
+from app.database import init_db
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# Create database tables only when asked to; normally run once via `python -m app.init_db`
+if os.environ.get("AUTO_CREATE_TABLES") == "1":
+    init_db()
 
+# orjson encodes responses, including datetimes, natively. Routes that return
+# raw datetimes return ORJSONResponse directly, which also skips jsonable_encoder.
+# FastAPI 0.131+ deprecates ORJSONResponse, hence the upper bound in requirements.txt
 app = FastAPI(
     title="MindTrack API",
     description="AI Mental Wellness Companion Backend",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS - allows environment variable for Render deployment
-# Default to localhost for development
-# In production, use environment variable CORS_ORIGINS or allow all (use with caution)
-cors_origins_env = os.environ.get("CORS_ORIGINS", "")
-
-# If CORS_ORIGINS is set, use it; otherwise use defaults
-if cors_origins_env:
-    cors_origins = cors_origins_env.split(",")
-else:
-    # Development defaults
-    cors_origins = ["http://localhost:3000", "http://localhost:5173"]
-
-# Add production frontend URL
-cors_origins.append("https://mentalhealthfrontend-3.onrender.com")
+# CORS_ORIGINS is a comma-separated list; defaults to localhost for development.
+# The production frontend URL is always allowed.
+cors_origins = tuple(
+    origin.strip()
+    for origin in (os.environ.get("CORS_ORIGINS") or "http://localhost:3000,http://localhost:5173").split(",")
+    if origin.strip()
+) + ("https://mentalhealthfrontend-3.onrender.com",)
 
 app.add_middleware(
     CORSMiddleware,
@@ -42,11 +42,15 @@ app.add_middleware(
 )
 
 # Include routers
-app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(users.router, prefix="/api/users", tags=["Users"])
-app.include_router(questionnaire.router, prefix="/api/questionnaire", tags=["Questionnaire"])
-app.include_router(predictions.router, prefix="/api/predictions", tags=["Predictions"])
-app.include_router(statistics.router, prefix="/api/statistics", tags=["Statistics"])
+_ROUTERS = (
+    (auth.router, "/api/auth", "Authentication"),
+    (users.router, "/api/users", "Users"),
+    (questionnaire.router, "/api/questionnaire", "Questionnaire"),
+    (predictions.router, "/api/predictions", "Predictions"),
+    (statistics.router, "/api/statistics", "Statistics"),
+)
+for router, prefix, tag in _ROUTERS:
+    app.include_router(router, prefix=prefix, tags=[tag])
 
 @app.get("/")
 def root():
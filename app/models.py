@@ -2,11 +2,15 @@
 MindTrack Database Models
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, JSON, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, JSON, Text, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
 
+# JSONB on PostgreSQL (binary, indexable), plain JSON elsewhere (SQLite dev)
+JSON_TYPE = JSON().with_variant(JSONB(), "postgresql")
+
 class User(Base):
     """User model for authentication"""
     __tablename__ = "users"
@@ -27,10 +31,13 @@ class User(Base):
 class UserResponse(Base):
     """User questionnaire responses"""
     __tablename__ = "user_responses"
+    __table_args__ = (
+        Index("ix_user_responses_user_created", "user_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    questionnaire_data = Column(JSON, nullable=False)
+    questionnaire_data = Column(JSON_TYPE, nullable=False)
     risk_score = Column(Float)  # ML predicted risk score (0-100)
     risk_level = Column(String(20))  # Low, Medium, High
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -41,13 +48,17 @@ class UserResponse(Base):
 class Prediction(Base):
     """ML model predictions"""
     __tablename__ = "predictions"
+    __table_args__ = (
+        Index("ix_predictions_user_created", "user_id", "created_at"),
+        Index("ix_predictions_factors_gin", "factors", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     risk_level = Column(String(20), nullable=False)
     risk_score = Column(Float, nullable=False)
-    factors = Column(JSON)  # Key risk factors identified
-    recommendations = Column(JSON)  # Personalized recommendations
+    factors = Column(JSON_TYPE)  # Key risk factors identified
+    recommendations = Column(JSON_TYPE)  # Personalized recommendations
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
@@ -56,6 +67,9 @@ class Prediction(Base):
 class UserProgress(Base):
     """User progress tracking over time"""
     __tablename__ = "user_progress"
+    __table_args__ = (
+        Index("ix_progress_user_date", "user_id", "date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -72,9 +86,10 @@ class SurveyData(Base):
     __tablename__ = "survey_data"
     
     id = Column(Integer, primary_key=True, index=True)
-    year_group = Column(String(20))
-    gender = Column(String(20))
-    ethnicity = Column(String(50))
+    # Indexed for the GROUP BY aggregates behind the statistics endpoints
+    year_group = Column(String(20), index=True)
+    gender = Column(String(20), index=True)
+    ethnicity = Column(String(50), index=True)
     # Emotional responses (encoded as numeric)
     feel_sad = Column(Integer)
     feel_lonely = Column(Integer)
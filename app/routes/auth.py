@@ -2,11 +2,15 @@
 MindTrack Authentication Routes
 """
 
-from datetime import timedelta
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 from app.database import get_db
 from app.auth import (
@@ -20,12 +24,16 @@ from app.models import User
 
 router = APIRouter()
 
+# Serialized /me bodies keyed on (user id, updated_at) so profile edits miss the cache
+_me_cache = TTLCache(maxsize=5000, ttl=30)
+_me_cache_lock = threading.Lock()
+
 # Pydantic models for request/response
 class UserCreate(BaseModel):
     username: str
     email: EmailStr
     password: str
-    full_name: str = None
+    full_name: Optional[str] = None
 
 class UserLogin(BaseModel):
     username: str
@@ -39,11 +47,10 @@ class UserResponse(BaseModel):
     id: int
     username: str
     email: str
-    full_name: str = None
-    created_at: str
+    full_name: Optional[str] = None
+    created_at: datetime
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 @router.post("/signup", response_model=UserResponse)
 def signup(user_data: UserCreate, db: Session = Depends(get_db)):
@@ -56,13 +63,8 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
             password=user_data.password,
             full_name=user_data.full_name
         )
-        return UserResponse(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            full_name=user.full_name,
-            created_at=user.created_at.isoformat()
-        )
+        # response_model validates the ORM user once via from_attributes
+        return user
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -72,9 +74,9 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
         )
 
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """Login and get access token"""
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -84,7 +86,7 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
+        data={"sub": user.username, "uid": user.id}, expires_delta=access_token_expires
     )
     
     return {"access_token": access_token, "token_type": "bearer"}
@@ -92,13 +94,22 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
 @router.get("/me", response_model=UserResponse)
 def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current user information"""
-    return UserResponse(
-        id=current_user.id,
-        username=current_user.username,
-        email=current_user.email,
-        full_name=current_user.full_name,
-        created_at=current_user.created_at.isoformat()
-    )
+    key = (current_user.id, current_user.updated_at)
+    with _me_cache_lock:
+        body = _me_cache.get(key)
+    
+    if body is None:
+        body = {
+            "id": current_user.id,
+            "username": current_user.username,
+            "email": current_user.email,
+            "full_name": current_user.full_name,
+            "created_at": current_user.created_at
+        }
+        with _me_cache_lock:
+            _me_cache[key] = body
+    
+    return ORJSONResponse(body)
 
 @router.post("/logout")
 def logout():
@@ -3,8 +3,11 @@ MindTrack Predictions Routes
 """
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import case, cast, func, select, true
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 
@@ -20,10 +23,9 @@ class PredictionResponse(BaseModel):
     risk_score: float
     factors: List[str]
     recommendations: List[str]
-    created_at: str
+    created_at: datetime
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 @router.get("/history", response_model=List[PredictionResponse])
 def get_prediction_history(
@@ -38,15 +40,16 @@ def get_prediction_history(
         .limit(limit)\
         .all()
     
+    # Plain dicts: response_model validates once, no intermediate models
     return [
-        PredictionResponse(
-            id=p.id,
-            risk_level=p.risk_level,
-            risk_score=p.risk_score,
-            factors=p.factors or [],
-            recommendations=p.recommendations or [],
-            created_at=p.created_at.isoformat()
-        )
+        {
+            "id": p.id,
+            "risk_level": p.risk_level,
+            "risk_score": p.risk_score,
+            "factors": p.factors or [],
+            "recommendations": p.recommendations or [],
+            "created_at": p.created_at
+        }
         for p in predictions
     ]
 
@@ -67,66 +70,102 @@ def get_latest_prediction(
             detail="No predictions found. Please complete a questionnaire first."
         )
     
-    return {
+    return ORJSONResponse({
         "id": prediction.id,
         "risk_level": prediction.risk_level,
         "risk_score": prediction.risk_score,
         "factors": prediction.factors or [],
         "recommendations": prediction.recommendations or [],
-        "created_at": prediction.created_at.isoformat()
-    }
+        "created_at": prediction.created_at
+    })
 
 @router.get("/trends")
 def get_prediction_trends(
     days: int = 30,
+    include_points: bool = True,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get prediction trends over time"""
     start_date = datetime.utcnow() - timedelta(days=days)
-    
-    predictions = db.query(Prediction)\
-        .filter(
-            Prediction.user_id == current_user.id,
-            Prediction.created_at >= start_date
-        )\
-        .order_by(Prediction.created_at.asc())\
-        .all()
-    
-    if not predictions:
+    in_period = (
+        Prediction.user_id == current_user.id,
+        Prediction.created_at >= start_date
+    )
+    
+    if include_points:
+        # Points are needed anyway: one query, summary computed from those rows.
+        # Only the plotted columns; skips hydrating factors/recommendations JSON
+        points = db.query(Prediction.created_at, Prediction.risk_score, Prediction.risk_level)\
+            .filter(*in_period)\
+            .order_by(Prediction.created_at.asc(), Prediction.id.asc())\
+            .all()
+        total = len(points)
+        if total:
+            avg_score = sum(point.risk_score for point in points) / total
+            first, last = points[0].risk_score, points[-1].risk_score
+    else:
+        # Summary only: average, count and the first/last scores of the period in SQL
+        first_score = db.query(Prediction.risk_score)\
+            .filter(*in_period)\
+            .order_by(Prediction.created_at.asc(), Prediction.id.asc())\
+            .limit(1)\
+            .scalar_subquery()
+        last_score = db.query(Prediction.risk_score)\
+            .filter(*in_period)\
+            .order_by(Prediction.created_at.desc(), Prediction.id.desc())\
+            .limit(1)\
+            .scalar_subquery()
+        avg_score, total, first, last = db.query(
+                func.avg(Prediction.risk_score),
+                func.count(Prediction.id),
+                first_score,
+                last_score
+            )\
+            .filter(*in_period)\
+            .one()
+    
+    if not total:
         return {
             "message": "No data available for the selected period",
             "trends": []
         }
     
-    # Calculate trends
-    scores = [p.risk_score for p in predictions]
-    avg_score = sum(scores) / len(scores)
-    
     # Determine trend direction
-    if len(scores) >= 2:
-        if scores[-1] < scores[0]:
+    if total >= 2:
+        if last < first:
             trend = "improving"
-        elif scores[-1] > scores[0]:
+        elif last > first:
             trend = "declining"
         else:
             trend = "stable"
     else:
         trend = "insufficient_data"
     
-    return {
+    result = {
         "average_score": round(avg_score, 2),
         "trend": trend,
-        "total_predictions": len(predictions),
-        "data_points": [
+        "total_predictions": total
+    }
+    
+    if include_points:
+        result["data_points"] = [
             {
-                "date": p.created_at.isoformat(),
-                "score": p.risk_score,
-                "level": p.risk_level
+                "date": created_at,
+                "score": risk_score,
+                "level": risk_level
             }
-            for p in predictions
+            for created_at, risk_score, risk_level in points
         ]
-    }
+    
+    return ORJSONResponse(result)
+
+def _factor_elements(db: Session):
+    """Table-valued function expanding Prediction.factors into one row per factor"""
+    if db.get_bind().dialect.name == "postgresql":
+        # The cast keeps this working on databases where factors is still json
+        return func.jsonb_array_elements_text(cast(Prediction.factors, JSONB)).table_valued("value")
+    return func.json_each(Prediction.factors).table_valued("value")
 
 @router.get("/insights")
 def get_personalized_insights(
@@ -134,13 +173,30 @@ def get_personalized_insights(
     db: Session = Depends(get_db)
 ):
     """Get personalized insights based on prediction history"""
-    predictions = db.query(Prediction)\
+    # The 30 most recent predictions, ranked from both ends
+    recent = db.query(Prediction.id, Prediction.risk_level, Prediction.risk_score, Prediction.created_at)\
         .filter(Prediction.user_id == current_user.id)\
-        .order_by(Prediction.created_at.desc())\
+        .order_by(Prediction.created_at.desc(), Prediction.id.desc())\
         .limit(30)\
-        .all()
+        .subquery()
+    ranked = db.query(
+            recent,
+            func.row_number().over(order_by=(recent.c.created_at.desc(), recent.c.id.desc())).label("newest"),
+            func.row_number().over(order_by=(recent.c.created_at.asc(), recent.c.id.asc())).label("oldest")
+        )\
+        .subquery()
+    
+    total, high_count, medium_count, low_count, recent_avg, older_avg = db.query(
+            func.count(),
+            func.coalesce(func.sum(case((ranked.c.risk_level == "High", 1), else_=0)), 0),
+            func.coalesce(func.sum(case((ranked.c.risk_level == "Medium", 1), else_=0)), 0),
+            func.coalesce(func.sum(case((ranked.c.risk_level == "Low", 1), else_=0)), 0),
+            func.avg(case((ranked.c.newest <= 3, ranked.c.risk_score))),
+            func.avg(case((ranked.c.oldest <= 3, ranked.c.risk_score)))
+        )\
+        .one()
     
-    if not predictions:
+    if not total:
         return {
             "insights": [],
             "message": "Complete questionnaires to receive personalized insights"
@@ -149,12 +205,7 @@ def get_personalized_insights(
     insights = []
     
     # Analyze risk levels
-    risk_levels = [p.risk_level for p in predictions]
-    high_count = risk_levels.count("High")
-    medium_count = risk_levels.count("Medium")
-    low_count = risk_levels.count("Low")
-    
-    if high_count > len(predictions) * 0.5:
+    if high_count > total * 0.5:
         insights.append({
             "type": "warning",
             "title": "Consistently High Risk",
@@ -162,10 +213,7 @@ def get_personalized_insights(
         })
     
     # Analyze improvement
-    if len(predictions) >= 3:
-        recent_avg = sum([p.risk_score for p in predictions[:3]]) / 3
-        older_avg = sum([p.risk_score for p in predictions[-3:]]) / 3
-        
+    if total >= 3:
         if recent_avg < older_avg - 10:
             insights.append({
                 "type": "positive",
@@ -174,27 +222,28 @@ def get_personalized_insights(
             })
     
     # Common factors analysis
-    all_factors = []
-    for p in predictions:
-        if p.factors:
-            all_factors.extend(p.factors)
-    
-    if all_factors:
-        from collections import Counter
-        factor_counts = Counter(all_factors)
-        common_factors = factor_counts.most_common(3)
-        
-        if common_factors:
-            insights.append({
-                "type": "info",
-                "title": "Common Challenges",
-                "message": f"Most common factors: {', '.join([f[0] for f in common_factors])}"
-            })
+    factor = _factor_elements(db)
+    factor_count = func.count().label("factor_count")
+    common_factors = db.query(factor.c.value, factor_count)\
+        .select_from(Prediction)\
+        .join(factor, true())\
+        .filter(Prediction.id.in_(select(recent.c.id)))\
+        .group_by(factor.c.value)\
+        .order_by(factor_count.desc(), factor.c.value)\
+        .limit(3)\
+        .all()
+    
+    if common_factors:
+        insights.append({
+            "type": "info",
+            "title": "Common Challenges",
+            "message": f"Most common factors: {', '.join([f[0] for f in common_factors])}"
+        })
     
     return {
         "insights": insights,
         "summary": {
-            "total_assessments": len(predictions),
+            "total_assessments": total,
             "high_risk_count": high_count,
             "medium_risk_count": medium_count,
             "low_risk_count": low_count
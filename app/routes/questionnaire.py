@@ -2,10 +2,13 @@
 MindTrack Questionnaire Routes
 """
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
-from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime
 
 from app.database import get_db
 from app.auth import get_current_user
@@ -51,10 +54,9 @@ class QuestionnaireResponse(BaseModel):
     id: int
     risk_score: Optional[float]
     risk_level: Optional[str]
-    created_at: str
+    created_at: datetime
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 @router.post("/submit")
 def submit_questionnaire(
@@ -63,51 +65,21 @@ def submit_questionnaire(
     db: Session = Depends(get_db)
 ):
     """Submit questionnaire and get prediction"""
-    # Store the response
-    response = UserResponse(
-        user_id=current_user.id,
-        questionnaire_data=data.dict()
-    )
+    response_row, prediction_row = build_rows(current_user.id, data.model_dump())
+    response = UserResponse(**response_row)
     
-    db.add(response)
-    db.commit()
-    db.refresh(response)
-    
-    # Calculate risk score (simplified - will be replaced with ML model)
-    risk_score = calculate_risk_score(data.dict())
-    
-    # Determine risk level
-    if risk_score < 30:
-        risk_level = "Low"
-    elif risk_score < 60:
-        risk_level = "Medium"
-    else:
-        risk_level = "High"
-    
-    # Update response with risk score
-    response.risk_score = risk_score
-    response.risk_level = risk_level
-    db.commit()
-    
-    # Generate prediction with recommendations
-    prediction = generate_prediction(risk_score, risk_level, data.dict())
-    prediction_response = Prediction(
-        user_id=current_user.id,
-        risk_level=risk_level,
-        risk_score=risk_score,
-        factors=prediction["factors"],
-        recommendations=prediction["recommendations"]
-    )
-    
-    db.add(prediction_response)
+    # Write both rows in a single transaction
+    db.add_all([response, Prediction(**prediction_row)])
+    db.flush()
+    response_id = response.id
     db.commit()
     
     return {
-        "response_id": response.id,
-        "risk_score": risk_score,
-        "risk_level": risk_level,
-        "factors": prediction["factors"],
-        "recommendations": prediction["recommendations"],
+        "response_id": response_id,
+        "risk_score": response_row["risk_score"],
+        "risk_level": response_row["risk_level"],
+        "factors": prediction_row["factors"],
+        "recommendations": prediction_row["recommendations"],
         "message": "Questionnaire submitted successfully"
     }
 
@@ -124,74 +96,122 @@ def get_questionnaire_history(
         .limit(limit)\
         .all()
     
-    return [
-        QuestionnaireResponse(
-            id=r.id,
-            risk_score=r.risk_score,
-            risk_level=r.risk_level,
-            created_at=r.created_at.isoformat()
-        )
-        for r in responses
-    ]
+    # response_model validates the ORM rows once via from_attributes
+    return responses
+
+# Scoring inputs in column order, with the default used when a field is missing
+SCORE_FIELDS = (
+    ("feel_sad", 1), ("feel_lonely", 1), ("feel_stressed", 1), ("feel_angry", 1),
+    ("feel_confident", 1), ("feel_happy", 1),
+    ("hours_sleep", 8), ("minutes_physical_activity", 0),
+    ("friends_count", 3), ("family_support", 3), ("school_belonging", 3),
+    ("self_harm_ever", False), ("bullied_recently", False),
+    ("stress_level", 1), ("anxiety_level", 1),
+)
+_COL = {name: i for i, (name, _) in enumerate(SCORE_FIELDS)}
+
+def _score_row(data: Dict[str, Any]) -> List[float]:
+    """Flatten questionnaire data into one scoring row"""
+    return [data.get(name, default) for name, default in SCORE_FIELDS]
+
+def _score_batch(rows: np.ndarray) -> np.ndarray:
+    """Calculate risk scores for an (N, len(SCORE_FIELDS)) array of rows"""
+    def col(name):
+        return rows[:, _COL[name]]
 
-def calculate_risk_score(data: Dict[str, Any]) -> float:
-    """Calculate risk score based on questionnaire data"""
-    score = 0
-    max_score = 100
-    
     # Emotional factors (0-20 points)
-    negative_emotions = data.get("feel_sad", 1) + data.get("feel_lonely", 1) + \
-                        data.get("feel_stressed", 1) + data.get("feel_angry", 1)
-    positive_emotions = data.get("feel_confident", 1) + data.get("feel_happy", 1)
-    score += (negative_emotions - positive_emotions) * 2
-    
+    negative_emotions = rows[:, _COL["feel_sad"]:_COL["feel_angry"] + 1].sum(axis=1)
+    positive_emotions = rows[:, _COL["feel_confident"]:_COL["feel_happy"] + 1].sum(axis=1)
+    score = (negative_emotions - positive_emotions) * 2
+
     # Sleep (0-15 points)
-    sleep = data.get("hours_sleep", 8)
-    if sleep < 6:
-        score += 15
-    elif sleep < 7:
-        score += 10
-    elif sleep < 8:
-        score += 5
-    
+    sleep = col("hours_sleep")
+    score += np.select([sleep < 6, sleep < 7, sleep < 8], [15, 10, 5], 0)
+
     # Physical activity (0-10 points)
-    activity = data.get("minutes_physical_activity", 0)
-    if activity < 30:
-        score += 10
-    elif activity < 60:
-        score += 5
-    
+    activity = col("minutes_physical_activity")
+    score += np.select([activity < 30, activity < 60], [10, 5], 0)
+
     # Social factors (0-15 points)
-    friends = data.get("friends_count", 3)
-    if friends < 2:
-        score += 10
-    elif friends < 3:
-        score += 5
-    
-    family_support = data.get("family_support", 3)
-    if family_support < 3:
-        score += 5
-    
+    friends = col("friends_count")
+    score += np.select([friends < 2, friends < 3], [10, 5], 0)
+    score += np.where(col("family_support") < 3, 5, 0)
+
     # School belonging (0-10 points)
-    belonging = data.get("school_belonging", 3)
-    if belonging < 3:
-        score += 10
-    elif belonging < 4:
-        score += 5
-    
-    # Self-harm (0-15 points)
-    if data.get("self_harm_ever", False):
-        score += 15
-    
-    # Bullying (0-10 points)
-    if data.get("bullied_recently", False):
-        score += 10
-    
+    belonging = col("school_belonging")
+    score += np.select([belonging < 3, belonging < 4], [10, 5], 0)
+
+    # Self-harm (0-15 points) and bullying (0-10 points)
+    score += np.where(col("self_harm_ever") != 0, 15, 0)
+    score += np.where(col("bullied_recently") != 0, 10, 0)
+
     # Stress and anxiety (0-5 points each)
-    score += data.get("stress_level", 1) - 1
-    score += data.get("anxiety_level", 1) - 1
-    
-    return min(max(score, 0), 100)
+    score += col("stress_level") - 1
+    score += col("anxiety_level") - 1
+
+    return np.clip(score, 0, 100)
+
+def calculate_risk_score(data: Dict[str, Any]) -> float:
+    """Calculate risk score based on questionnaire data"""
+    rows = np.array([_score_row(data)], dtype=np.float64)
+    return float(_score_batch(rows)[0])
+
+# Risk factor rules: (predicate, factor, recommendations), checked in order
+_PREDICTION_RULES = (
+    (
+        lambda d: d.get("hours_sleep", 8) < 7,
+        "Poor sleep patterns",
+        ("Try to get 7-9 hours of sleep each night. Establish a regular bedtime routine.",)
+    ),
+    (
+        lambda d: d.get("minutes_physical_activity", 0) < 60,
+        "Low physical activity",
+        ("Aim for at least 60 minutes of physical activity per day. Even a 10-minute walk can help.",)
+    ),
+    (
+        lambda d: d.get("feel_sad", 1) >= 4,
+        "Feelings of sadness",
+        ("Consider talking to someone you trust about how you're feeling. Practice self-care activities.",)
+    ),
+    (
+        lambda d: d.get("feel_stressed", 1) >= 4,
+        "High stress levels",
+        ("Try stress management techniques like deep breathing, meditation, or taking breaks.",)
+    ),
+    (
+        lambda d: d.get("self_harm_ever", False),
+        "History of self-harm",
+        ("Please consider reaching out to a mental health professional for support.",
+         "You can contact Samaritans helpline: 116 123")
+    ),
+    (
+        lambda d: d.get("bullied_recently", False),
+        "Recent bullying experience",
+        ("Speak to a trusted adult or teacher about what's happening.",
+         "Remember: it's not your fault, and help is available.")
+    ),
+    (
+        lambda d: d.get("family_support", 3) < 3,
+        "Limited family support",
+        ("Consider building support networks through friends, mentors, or school counselors.",)
+    ),
+)
+
+# General recommendations by risk level
+_GENERAL_RECOMMENDATIONS = {
+    "High": (
+        "Consider scheduling an appointment with a mental health professional.",
+        "Practice daily mindfulness or grounding exercises."
+    ),
+    "Medium": (
+        "Regular exercise and healthy sleep can help improve your mental health.",
+        "Try keeping a mood journal to track your emotions."
+    ),
+    "Low": (
+        "Great job taking care of your mental health! Keep up the good work.",
+        "Continue maintaining healthy habits and supporting others."
+    ),
+}
 
 def generate_prediction(risk_score: float, risk_level: str, data: Dict[str, Any]) -> Dict:
     """Generate personalized prediction and recommendations"""
@@ -199,48 +219,75 @@ def generate_prediction(risk_score: float, risk_level: str, data: Dict[str, Any]
     recommendations = []
     
     # Identify risk factors
-    if data.get("hours_sleep", 8) < 7:
-        factors.append("Poor sleep patterns")
-        recommendations.append("Try to get 7-9 hours of sleep each night. Establish a regular bedtime routine.")
-    
-    if data.get("minutes_physical_activity", 0) < 60:
-        factors.append("Low physical activity")
-        recommendations.append("Aim for at least 60 minutes of physical activity per day. Even a 10-minute walk can help.")
-    
-    if data.get("feel_sad", 1) >= 4:
-        factors.append("Feelings of sadness")
-        recommendations.append("Consider talking to someone you trust about how you're feeling. Practice self-care activities.")
-    
-    if data.get("feel_stressed", 1) >= 4:
-        factors.append("High stress levels")
-        recommendations.append("Try stress management techniques like deep breathing, meditation, or taking breaks.")
-    
-    if data.get("self_harm_ever", False):
-        factors.append("History of self-harm")
-        recommendations.append("Please consider reaching out to a mental health professional for support.")
-        recommendations.append("You can contact Samaritans helpline: 116 123")
-    
-    if data.get("bullied_recently", False):
-        factors.append("Recent bullying experience")
-        recommendations.append("Speak to a trusted adult or teacher about what's happening.")
-        recommendations.append("Remember: it's not your fault, and help is available.")
-    
-    if data.get("family_support", 3) < 3:
-        factors.append("Limited family support")
-        recommendations.append("Consider building support networks through friends, mentors, or school counselors.")
+    for predicate, factor, factor_recommendations in _PREDICTION_RULES:
+        if predicate(data):
+            factors.append(factor)
+            recommendations.extend(factor_recommendations)
     
     # Add general recommendations
-    if risk_level == "High":
-        recommendations.append("Consider scheduling an appointment with a mental health professional.")
-        recommendations.append("Practice daily mindfulness or grounding exercises.")
-    elif risk_level == "Medium":
-        recommendations.append("Regular exercise and healthy sleep can help improve your mental health.")
-        recommendations.append("Try keeping a mood journal to track your emotions.")
-    else:
-        recommendations.append("Great job taking care of your mental health! Keep up the good work.")
-        recommendations.append("Continue maintaining healthy habits and supporting others.")
+    recommendations.extend(_GENERAL_RECOMMENDATIONS.get(risk_level, _GENERAL_RECOMMENDATIONS["Low"]))
     
     return {
         "factors": factors,
         "recommendations": recommendations
     }
+
+def build_rows(user_id: int, data: Dict[str, Any], risk_score: Optional[float] = None) -> Tuple[Dict, Dict]:
+    """Build the user_responses and predictions rows for one questionnaire"""
+    # Calculate risk score (simplified - will be replaced with ML model)
+    if risk_score is None:
+        risk_score = calculate_risk_score(data)
+    
+    # Determine risk level
+    if risk_score < 30:
+        risk_level = "Low"
+    elif risk_score < 60:
+        risk_level = "Medium"
+    else:
+        risk_level = "High"
+    
+    # Generate prediction with recommendations
+    prediction = generate_prediction(risk_score, risk_level, data)
+    
+    response_row = {
+        "user_id": user_id,
+        "questionnaire_data": data,
+        "risk_score": risk_score,
+        "risk_level": risk_level
+    }
+    prediction_row = {
+        "user_id": user_id,
+        "risk_level": risk_level,
+        "risk_score": risk_score,
+        "factors": prediction["factors"],
+        "recommendations": prediction["recommendations"]
+    }
+    return response_row, prediction_row
+
+def backfill_questionnaires(
+    db: Session,
+    user_id: int,
+    records: List[Dict[str, Any]],
+    created_at: Optional[List[Optional[datetime]]] = None
+) -> int:
+    """Score and bulk-insert many questionnaires for a user in one commit
+    
+    created_at, when given, holds each record's original timestamp;
+    records without one (or all, when omitted) are stamped with now.
+    """
+    if not records:
+        return 0
+    
+    scores = _score_batch(np.array([_score_row(d) for d in records], dtype=np.float64)).tolist()
+    rows = [build_rows(user_id, d, score) for d, score in zip(records, scores)]
+    
+    # Every executemany row needs the same keys, so the timestamp is always set
+    now = datetime.utcnow()
+    for (response_row, prediction_row), timestamp in zip(rows, created_at or [None] * len(rows)):
+        response_row["created_at"] = prediction_row["created_at"] = timestamp or now
+    
+    db.execute(insert(UserResponse), [response_row for response_row, _ in rows])
+    db.execute(insert(Prediction), [prediction_row for _, prediction_row in rows])
+    db.commit()
+    
+    return len(rows)
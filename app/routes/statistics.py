@@ -2,13 +2,18 @@
 MindTrack Statistics Routes
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, literal, select, union_all
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+import hashlib
 import json
 import os
+import threading
+import orjson
+from cachetools import TTLCache
 
 from app.database import get_db
 from app.auth import get_current_user
@@ -32,203 +37,289 @@ class OverallStats(BaseModel):
     high_risk_percentage: float
     common_factors: List[str]
 
+# Static statistics payloads, encoded once at import so handlers only write bytes
+
+# This will be populated from the actual survey data
+# For now, return sample structure
+_OVERVIEW_JSON = orjson.dumps({
+    "total_surveys": 21958,
+    "date_range": "2018-2019",
+    "location": "Leeds, UK",
+    "year_groups": ["Year 7", "Year 8", "Year 9", "Year 10", "Year 11", "Year 12", "Year 13"]
+})
+
+_DEMOGRAPHICS_JSON = orjson.dumps({
+    "gender": [
+        {"label": "Female", "value": 51.2},
+        {"label": "Male", "value": 47.5},
+        {"label": "Other/Prefer not to say", "value": 1.3}
+    ],
+    "year_groups": [
+        {"label": "Year 7", "value": 15.2},
+        {"label": "Year 8", "value": 14.8},
+        {"label": "Year 9", "value": 15.1},
+        {"label": "Year 10", "value": 14.5},
+        {"label": "Year 11", "value": 15.8},
+        {"label": "Year 12", "value": 13.2},
+        {"label": "Year 13", "value": 11.4}
+    ],
+    "ethnicity": [
+        {"label": "White British", "value": 52.3},
+        {"label": "Asian", "value": 18.4},
+        {"label": "Mixed", "value": 12.1},
+        {"label": "Black", "value": 9.8},
+        {"label": "Other", "value": 7.4}
+    ]
+})
+
+_EMOTIONS_JSON = orjson.dumps({
+    "feel_happy": {
+        "every_day": 28.5,
+        "most_days": 35.2,
+        "some_days": 24.8,
+        "rarely": 8.9,
+        "never": 2.6
+    },
+    "feel_sad": {
+        "every_day": 12.3,
+        "most_days": 18.7,
+        "some_days": 38.5,
+        "rarely": 21.2,
+        "never": 9.3
+    },
+    "feel_stressed": {
+        "every_day": 15.8,
+        "most_days": 24.3,
+        "some_days": 35.1,
+        "rarely": 16.4,
+        "never": 8.4
+    },
+    "feel_lonely": {
+        "every_day": 8.2,
+        "most_days": 12.5,
+        "some_days": 28.7,
+        "rarely": 31.2,
+        "never": 19.4
+    }
+})
+
+_RISK_FACTORS_JSON = orjson.dumps({
+    "self_harm": {
+        "ever_harmed": 18.5,
+        "never_harmed": 81.5
+    },
+    "bullying": {
+        "bullied_recently": 23.4,
+        "not_bullied": 76.6
+    },
+    "sleep": {
+        "less_than_6_hours": 15.2,
+        "6_to_8_hours": 45.8,
+        "more_than_8_hours": 39.0
+    },
+    "physical_activity": {
+        "active_60plus_minutes": 48.3,
+        "active_30_to_60_minutes": 28.7,
+        "less_active": 23.0
+    }
+})
+
+_SUPPORT_JSON = orjson.dumps({
+    "seek_help_school": {
+        "yes": 42.3,
+        "no": 57.7
+    },
+    "know_where_to_get_help": {
+        "yes_definitely": 35.8,
+        "yes_probably": 28.4,
+        "no_probably_not": 21.2,
+        "no_definitely_not": 14.6
+    },
+    "trusted_adults": {
+        "parents": 68.5,
+        "friends": 52.3,
+        "school_staff": 38.7,
+        "no_one": 8.2
+    }
+})
+
+_CATEGORIES_JSON = orjson.dumps({
+    "categories": [
+        "demographics",
+        "mental-health/emotions",
+        "mental-health/risk-factors",
+        "mental-health/support",
+        "lifestyle",
+        "school-experience"
+    ]
+})
+
+_LIFESTYLE_JSON = orjson.dumps({
+    "breakfast": {
+        "every_day": 52.3,
+        "most_days": 22.8,
+        "some_days": 15.2,
+        "rarely": 9.7
+    },
+    "physical_activity_minutes": {
+        "0_to_60": 28.4,
+        "61_to_120": 31.2,
+        "121_to_180": 22.5,
+        "180_plus": 17.9
+    },
+    "screen_time": {
+        "less_than_2_hours": 18.5,
+        "2_to_4_hours": 42.3,
+        "4_to_6_hours": 28.7,
+        "more_than_6_hours": 10.5
+    },
+    "sleep_hours": {
+        "less_than_5": 8.2,
+        "5_to_6": 15.4,
+        "6_to_7": 28.7,
+        "7_to_8": 32.5,
+        "more_than_8": 15.2
+    }
+})
+
+_SCHOOL_EXPERIENCE_JSON = orjson.dumps({
+    "belong_school": {
+        "strongly_agree": 28.5,
+        "agree": 35.2,
+        "neutral": 22.8,
+        "disagree": 10.2,
+        "strongly_disagree": 3.3
+    },
+    "enjoy_school": {
+        "strongly_agree": 22.4,
+        "agree": 31.8,
+        "neutral": 25.2,
+        "disagree": 14.8,
+        "strongly_disagree": 5.8
+    },
+    "feel_safe": {
+        "very_safe": 52.3,
+        "safe": 32.5,
+        "unsafe": 10.8,
+        "very_unsafe": 4.4
+    },
+    "bullied_in_school": {
+        "yes_cyber": 8.5,
+        "yes_physical": 5.2,
+        "yes_verbal": 15.8,
+        "no": 70.5
+    }
+})
+
+# Quoted MD5 ETag for each static payload, hashed once at import
+_STATIC_ETAGS = {
+    content: '"%s"' % hashlib.md5(content, usedforsecurity=False).hexdigest()
+    for content in (
+        _OVERVIEW_JSON, _DEMOGRAPHICS_JSON, _EMOTIONS_JSON, _RISK_FACTORS_JSON,
+        _SUPPORT_JSON, _CATEGORIES_JSON, _LIFESTYLE_JSON, _SCHOOL_EXPERIENCE_JSON
+    )
+}
+
+def _static_response(request: Request, content: bytes) -> Response:
+    """Serve a frozen payload, or 304 if the client already holds this version"""
+    etag = _STATIC_ETAGS[content]
+    headers = {"cache-control": "public, max-age=3600", "etag": etag}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    
+    return Response(content=content, media_type="application/json", headers=headers)
+
 @router.get("/overview")
-def get_statistics_overview():
+def get_statistics_overview(request: Request):
     """Get overall statistics from survey data"""
-    # This will be populated from the actual survey data
-    # For now, return sample structure
-    return {
-        "total_surveys": 21958,
-        "date_range": "2018-2019",
-        "location": "Leeds, UK",
-        "year_groups": ["Year 7", "Year 8", "Year 9", "Year 10", "Year 11", "Year 12", "Year 13"]
-    }
+    return _static_response(request, _OVERVIEW_JSON)
 
 @router.get("/demographics")
-def get_demographics():
+def get_demographics(request: Request):
     """Get demographic distribution"""
-    return {
-        "gender": [
-            {"label": "Female", "value": 51.2},
-            {"label": "Male", "value": 47.5},
-            {"label": "Other/Prefer not to say", "value": 1.3}
-        ],
-        "year_groups": [
-            {"label": "Year 7", "value": 15.2},
-            {"label": "Year 8", "value": 14.8},
-            {"label": "Year 9", "value": 15.1},
-            {"label": "Year 10", "value": 14.5},
-            {"label": "Year 11", "value": 15.8},
-            {"label": "Year 12", "value": 13.2},
-            {"label": "Year 13", "value": 11.4}
-        ],
-        "ethnicity": [
-            {"label": "White British", "value": 52.3},
-            {"label": "Asian", "value": 18.4},
-            {"label": "Mixed", "value": 12.1},
-            {"label": "Black", "value": 9.8},
-            {"label": "Other", "value": 7.4}
-        ]
-    }
+    return _static_response(request, _DEMOGRAPHICS_JSON)
 
 @router.get("/mental-health/emotions")
-def get_emotion_statistics():
+def get_emotion_statistics(request: Request):
     """Get emotional wellbeing statistics"""
-    return {
-        "feel_happy": {
-            "every_day": 28.5,
-            "most_days": 35.2,
-            "some_days": 24.8,
-            "rarely": 8.9,
-            "never": 2.6
-        },
-        "feel_sad": {
-            "every_day": 12.3,
-            "most_days": 18.7,
-            "some_days": 38.5,
-            "rarely": 21.2,
-            "never": 9.3
-        },
-        "feel_stressed": {
-            "every_day": 15.8,
-            "most_days": 24.3,
-            "some_days": 35.1,
-            "rarely": 16.4,
-            "never": 8.4
-        },
-        "feel_lonely": {
-            "every_day": 8.2,
-            "most_days": 12.5,
-            "some_days": 28.7,
-            "rarely": 31.2,
-            "never": 19.4
-        }
-    }
+    return _static_response(request, _EMOTIONS_JSON)
 
 @router.get("/mental-health/risk-factors")
-def get_risk_factors():
+def get_risk_factors(request: Request):
     """Get common mental health risk factors"""
-    return {
-        "self_harm": {
-            "ever_harmed": 18.5,
-            "never_harmed": 81.5
-        },
-        "bullying": {
-            "bullied_recently": 23.4,
-            "not_bullied": 76.6
-        },
-        "sleep": {
-            "less_than_6_hours": 15.2,
-            "6_to_8_hours": 45.8,
-            "more_than_8_hours": 39.0
-        },
-        "physical_activity": {
-            "active_60plus_minutes": 48.3,
-            "active_30_to_60_minutes": 28.7,
-            "less_active": 23.0
-        }
-    }
+    return _static_response(request, _RISK_FACTORS_JSON)
 
 @router.get("/mental-health/support")
-def get_support_statistics():
+def get_support_statistics(request: Request):
     """Get statistics about support-seeking behavior"""
-    return {
-        "seek_help_school": {
-            "yes": 42.3,
-            "no": 57.7
-        },
-        "know_where_to_get_help": {
-            "yes_definitely": 35.8,
-            "yes_probably": 28.4,
-            "no_probably_not": 21.2,
-            "no_definitely_not": 14.6
-        },
-        "trusted_adults": {
-            "parents": 68.5,
-            "friends": 52.3,
-            "school_staff": 38.7,
-            "no_one": 8.2
-        }
-    }
+    return _static_response(request, _SUPPORT_JSON)
 
 @router.get("/categories")
-def get_all_categories():
+def get_all_categories(request: Request):
     """Get all available statistics categories"""
-    return {
-        "categories": [
-            "demographics",
-            "mental-health/emotions",
-            "mental-health/risk-factors",
-            "mental-health/support",
-            "lifestyle",
-            "school-experience"
-        ]
-    }
+    return _static_response(request, _CATEGORIES_JSON)
 
 @router.get("/lifestyle")
-def get_lifestyle_statistics():
+def get_lifestyle_statistics(request: Request):
     """Get lifestyle-related statistics"""
-    return {
-        "breakfast": {
-            "every_day": 52.3,
-            "most_days": 22.8,
-            "some_days": 15.2,
-            "rarely": 9.7
-        },
-        "physical_activity_minutes": {
-            "0_to_60": 28.4,
-            "61_to_120": 31.2,
-            "121_to_180": 22.5,
-            "180_plus": 17.9
-        },
-        "screen_time": {
-            "less_than_2_hours": 18.5,
-            "2_to_4_hours": 42.3,
-            "4_to_6_hours": 28.7,
-            "more_than_6_hours": 10.5
-        },
-        "sleep_hours": {
-            "less_than_5": 8.2,
-            "5_to_6": 15.4,
-            "6_to_7": 28.7,
-            "7_to_8": 32.5,
-            "more_than_8": 15.2
-        }
-    }
+    return _static_response(request, _LIFESTYLE_JSON)
 
 @router.get("/school-experience")
-def get_school_experience():
+def get_school_experience(request: Request):
     """Get school experience statistics"""
-    return {
-        "belong_school": {
-            "strongly_agree": 28.5,
-            "agree": 35.2,
-            "neutral": 22.8,
-            "disagree": 10.2,
-            "strongly_disagree": 3.3
-        },
-        "enjoy_school": {
-            "strongly_agree": 22.4,
-            "agree": 31.8,
-            "neutral": 25.2,
-            "disagree": 14.8,
-            "strongly_disagree": 5.8
-        },
-        "feel_safe": {
-            "very_safe": 52.3,
-            "safe": 32.5,
-            "unsafe": 10.8,
-            "very_unsafe": 4.4
-        },
-        "bullied_in_school": {
-            "yes_cyber": 8.5,
-            "yes_physical": 5.2,
-            "yes_verbal": 15.8,
-            "no": 70.5
-        }
-    }
+    return _static_response(request, _SCHOOL_EXPERIENCE_JSON)
+
+# Aggregates computed from SurveyData, cached per endpoint for 5 minutes
+_survey_stats_cache = TTLCache(maxsize=32, ttl=300)
+_survey_stats_lock = threading.Lock()
+
+# (response key, grouped column) for the survey demographics breakdown
+_DEMOGRAPHIC_COLUMNS = (
+    ("gender", SurveyData.gender),
+    ("year_groups", SurveyData.year_group),
+    ("ethnicity", SurveyData.ethnicity),
+)
+
+def _survey_demographics(db: Session) -> Dict[str, List[Dict[str, Any]]]:
+    """Demographic percentages from SurveyData, all dimensions in one round trip"""
+    query = union_all(*(
+        select(literal(key).label("dimension"), column.label("label"), func.count().label("count"))
+        .where(column.isnot(None))
+        .group_by(column)
+        for key, column in _DEMOGRAPHIC_COLUMNS
+    ))
+    
+    counts = {key: [] for key, _ in _DEMOGRAPHIC_COLUMNS}
+    for dimension, label, count in db.execute(query):
+        counts[dimension].append((label, count))
+    
+    result = {}
+    for key, rows in counts.items():
+        total = sum(count for _, count in rows)
+        result[key] = [
+            {"label": label, "value": round(count * 100.0 / total, 1)}
+            for label, count in sorted(rows, key=lambda row: row[1], reverse=True)
+        ]
+    return result
+
+@router.get("/survey/demographics", response_class=ORJSONResponse)
+def get_survey_demographics(db: Session = Depends(get_db)):
+    """Get demographic distribution computed from imported survey data"""
+    with _survey_stats_lock:
+        result = _survey_stats_cache.get("demographics")
+    
+    if result is None:
+        result = _survey_demographics(db)
+        with _survey_stats_lock:
+            _survey_stats_cache["demographics"] = result
+    
+    return result
 
-@router.get("/filter/{category}")
+@router.get("/filter/{category}", response_class=ORJSONResponse)
 def filter_by_category(
     category: str,
     filter_type: str = None,
@@ -2,7 +2,9 @@
 MindTrack User Routes
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Optional, List
@@ -13,30 +15,23 @@ from app.models import User, UserProgress
 
 router = APIRouter()
 
+# Most entries accepted by one /progress/bulk request (one transaction)
+MAX_BULK_PROGRESS = 500
+
 class ProgressCreate(BaseModel):
     mood_rating: int
-    notes: str = None
-
-class ProgressResponse(BaseModel):
-    id: int
-    date: str
-    risk_score: Optional[float]
-    mood_rating: int
-    notes: Optional[str]
-    
-    class Config:
-        orm_mode = True
+    notes: Optional[str] = None
 
 @router.get("/profile")
 def get_user_profile(current_user: User = Depends(get_current_user)):
     """Get user profile"""
-    return {
+    return ORJSONResponse({
         "id": current_user.id,
         "username": current_user.username,
         "email": current_user.email,
         "full_name": current_user.full_name,
-        "created_at": current_user.created_at.isoformat()
-    }
+        "created_at": current_user.created_at
+    })
 
 @router.put("/profile")
 def update_user_profile(
@@ -53,29 +48,36 @@ def update_user_profile(
     
     return {"message": "Profile updated successfully"}
 
-@router.get("/progress", response_model=List[ProgressResponse])
+@router.get("/progress")
 def get_user_progress(
     limit: int = 30,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user progress history"""
-    progress = db.query(UserProgress)\
+    # Column tuples only - no ORM entities or identity-map bookkeeping
+    progress = db.query(
+            UserProgress.id,
+            UserProgress.date,
+            UserProgress.risk_score,
+            UserProgress.mood_rating,
+            UserProgress.notes
+        )\
         .filter(UserProgress.user_id == current_user.id)\
         .order_by(UserProgress.date.desc())\
         .limit(limit)\
         .all()
     
-    return [
-        ProgressResponse(
-            id=p.id,
-            date=p.date.isoformat(),
-            risk_score=p.risk_score,
-            mood_rating=p.mood_rating,
-            notes=p.notes
-        )
-        for p in progress
-    ]
+    return ORJSONResponse([
+        {
+            "id": progress_id,
+            "date": date,
+            "risk_score": risk_score,
+            "mood_rating": mood_rating,
+            "notes": notes
+        }
+        for progress_id, date, risk_score, mood_rating, notes in progress
+    ])
 
 @router.post("/progress")
 def add_progress(
@@ -84,18 +86,45 @@ def add_progress(
     db: Session = Depends(get_db)
 ):
     """Add new progress entry"""
-    new_progress = UserProgress(
-        user_id=current_user.id,
-        mood_rating=progress_data.mood_rating,
-        notes=progress_data.notes
-    )
-    
-    db.add(new_progress)
+    # INSERT ... RETURNING gives back the generated id and date without a refresh SELECT
+    stmt = insert(UserProgress)\
+        .values(
+            user_id=current_user.id,
+            mood_rating=progress_data.mood_rating,
+            notes=progress_data.notes
+        )\
+        .returning(UserProgress.id, UserProgress.date)
+    progress_id, date = db.execute(stmt).one()
     db.commit()
-    db.refresh(new_progress)
     
     return {
         "message": "Progress added successfully",
-        "id": new_progress.id,
-        "date": new_progress.date.isoformat()
+        "id": progress_id,
+        "date": date.isoformat()
+    }
+
+@router.post("/progress/bulk")
+def add_progress_bulk(
+    progress_data: List[ProgressCreate] = Body(..., max_length=MAX_BULK_PROGRESS),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Add many progress entries in one multi-row insert"""
+    if progress_data:
+        db.execute(
+            insert(UserProgress),
+            [
+                {
+                    "user_id": current_user.id,
+                    "mood_rating": p.mood_rating,
+                    "notes": p.notes
+                }
+                for p in progress_data
+            ]
+        )
+        db.commit()
+    
+    return {
+        "message": "Progress added successfully",
+        "count": len(progress_data)
     }
@@ -2,6 +2,46 @@
 MindTrack ML Package
 """
 
+import logging
+import os
+import threading
+
 from .model import MentalHealthPredictor, train_model
+from .batching import PredictionBatcher
+
+MODEL_PATH = os.path.join(os.path.dirname(__file__), 'model.joblib')
+
+logger = logging.getLogger(__name__)
+
+# Loaded on first use and then shared by all requests; importing the package
+# (e.g. `python -m ml.model` to retrain) never touches model.joblib
+_predictor = None
+_predictor_lock = threading.Lock()
+
+def _load_predictor() -> MentalHealthPredictor:
+    """Load model.joblib, falling back to an untrained predictor"""
+    predictor = MentalHealthPredictor()
+    try:
+        predictor.load_model(MODEL_PATH)
+    except FileNotFoundError:
+        # Stays untrained until `python -m ml.model` writes model.joblib
+        pass
+    except Exception:
+        # Stale or corrupt file: serve "not trained" errors instead of failing
+        logger.exception("Could not load %s; retrain with `python -m ml.model`", MODEL_PATH)
+        predictor = MentalHealthPredictor()
+    return predictor
+
+def get_predictor() -> MentalHealthPredictor:
+    """Get the shared predictor (use as a FastAPI dependency)"""
+    global _predictor
+    if _predictor is None:
+        with _predictor_lock:
+            if _predictor is None:
+                _predictor = _load_predictor()
+    return _predictor
 
-__all__ = ['MentalHealthPredictor', 'train_model']
+__all__ = [
+    'MentalHealthPredictor', 'PredictionBatcher', 'train_model',
+    'get_predictor', 'MODEL_PATH'
+]
@@ -0,0 +1,90 @@
+"""
+MindTrack ML Prediction Batching
+"""
+
+import asyncio
+import numpy as np
+
+from .model import MentalHealthPredictor
+
+
+class PredictionBatcher:
+    """Micro-batches concurrent predictions into a single predict_proba call
+
+    Requests arriving within max_wait_ms of each other (up to max_batch_size)
+    are stacked into one (N, n_features) float32 array and scored together in
+    a worker thread, so the event loop keeps serving other requests.
+    """
+
+    def __init__(self, predictor: MentalHealthPredictor, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        self.predictor = predictor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = None
+        self._worker = None
+
+    async def predict_from_data(self, data: dict) -> dict:
+        """Queue one prediction from raw data and wait for its batched result"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((self.predictor.prepare_features(data), future))
+        return await future
+
+    async def close(self):
+        """Stop the background batching task and fail every pending request"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        # Requests still queued were never picked up by the worker
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            _fail(future, RuntimeError("PredictionBatcher closed"))
+
+    async def _run(self):
+        """Collect pending requests into batches until cancelled"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                # Keep collecting until the batch is full or the deadline passes
+                deadline = loop.time() + self.max_wait
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                # Inside the try: rows of different widths (e.g. feature_names
+                # changed by load_model mid-flight) fail this batch, not the worker
+                X = np.concatenate([features for features, _ in batch])
+                results = await loop.run_in_executor(None, self.predictor.predict_batch, X)
+            except asyncio.CancelledError:
+                # Closed while this batch was collecting or in flight
+                for _, future in batch:
+                    _fail(future, RuntimeError("PredictionBatcher closed"))
+                raise
+            except Exception as exc:
+                for _, future in batch:
+                    _fail(future, exc)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+def _fail(future: asyncio.Future, exc: BaseException):
+    """Resolve a waiting caller's future with an exception"""
+    if not future.done():
+        future.set_exception(exc)
@@ -4,19 +4,27 @@ MindTrack ML Model Module
 
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.preprocessing import StandardScaler, LabelEncoder
+from sklearn.ensemble import RandomForestClassifier, HistGradientBoostingClassifier
+from sklearn.preprocessing import LabelEncoder
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.metrics import classification_report, confusion_matrix, accuracy_score
 import joblib
 import os
 
+# Ordinal encoding for string answers; anything unrecognised maps to 0
+_STR_MAP = {
+    'never': 0.0, 'no': 0.0, 'false': 0.0,
+    'rarely': 1.0, 'sometimes': 1.0,
+    'often': 2.0, 'yes': 2.0, 'true': 2.0
+}
+
 class MentalHealthPredictor:
     """ML model for predicting mental health risk levels"""
     
     def __init__(self):
         self.model = None
-        self.scaler = StandardScaler()
+        # Only set for models saved with a fitted StandardScaler; tree models need none
+        self.scaler = None
         self.label_encoder = LabelEncoder()
         self.feature_names = [
             'feel_sad', 'feel_lonely', 'feel_confident', 'feel_stressed',
@@ -25,50 +33,58 @@ class MentalHealthPredictor:
             'self_harm_ever', 'bullied_recently', 'stress_level', 'anxiety_level'
         ]
         self.risk_levels = ['Low', 'Medium', 'High']
+        # Legacy scaler folded into one multiply-add: X * _inv_scale + _bias
+        self._inv_scale = None
+        self._bias = None
+        # Risk level for each predict_proba column (follows model.classes_)
+        self._class_levels = ()
         
     def prepare_features(self, data: dict) -> np.ndarray:
         """Prepare features from input data"""
-        features = []
-        
-        for feature in self.feature_names:
-            value = data.get(feature, 0)
-            
-            # Convert boolean to int
-            if isinstance(value, bool):
-                value = int(value)
-            
-            # Handle string values
-            if isinstance(value, str):
-                if value.lower() in ['never', 'no', 'false']:
-                    value = 0
-                elif value.lower() in ['rarely', 'sometimes']:
-                    value = 1
-                elif value.lower() in ['often', 'yes', 'true']:
-                    value = 2
-                else:
-                    value = 0
-            
-            features.append(float(value))
+        values = (data.get(feature, 0) for feature in self.feature_names)
+        
+        # Strings go through the ordinal map; booleans and numbers convert directly.
+        # count lets NumPy allocate the float32 row once, with no list in between
+        features = np.fromiter(
+            (_STR_MAP.get(value.lower(), 0.0) if isinstance(value, str) else value for value in values),
+            dtype=np.float32,
+            count=len(self.feature_names)
+        )
         
-        return np.array(features).reshape(1, -1)
+        # Reshaping a fresh 1-D array is a view, not a copy
+        return features.reshape(1, -1)
     
     def train(self, X_train: np.ndarray, y_train: np.ndarray):
         """Train the model"""
-        # Scale features
-        X_scaled = self.scaler.fit_transform(X_train)
-        
-        # Use Gradient Boosting for better performance
-        self.model = GradientBoostingClassifier(
-            n_estimators=100,
+        # Histogram-based gradient boosting: parallel, binned training and
+        # scale-invariant trees, so features are used unscaled
+        self.model = HistGradientBoostingClassifier(
+            max_iter=100,
             max_depth=5,
             learning_rate=0.1,
-            random_state=42
+            random_state=42,
+            early_stopping=True
         )
         
-        self.model.fit(X_scaled, y_train)
+        # float32 features end to end, matching prepare_features
+        self.model.fit(np.asarray(X_train, dtype=np.float32), y_train)
+        self.scaler = None
+        self._cache_inference()
         
         return self.model
     
+    def _cache_inference(self):
+        """Precompute per-model state used on every predict call"""
+        self._class_levels = tuple(self.risk_levels[label] for label in self.model.classes_)
+        
+        # Legacy fitted scaler as a float32 affine transform
+        if self.scaler is None:
+            self._inv_scale = None
+            self._bias = None
+            return
+        self._inv_scale = (1.0 / self.scaler.scale_).astype(np.float32)
+        self._bias = (-self.scaler.mean_ / self.scaler.scale_).astype(np.float32)
+    
     def predict(self, X: np.ndarray) -> dict:
         """Make predictions"""
         if self.model is None:
@@ -76,115 +92,128 @@ class MentalHealthPredictor:
                 'error': 'Model not trained. Please train the model first.'
             }
         
-        X_scaled = self.scaler.transform(X)
-        prediction = self.model.predict(X_scaled)
-        probability = self.model.predict_proba(X_scaled)
-        
-        # Get risk level
-        risk_level = self.risk_levels[prediction[0]]
-        
-        # Get confidence scores
-        confidence = {
-            level: float(prob[0][i])
-            for i, level in enumerate(self.risk_levels)
-        }
+        return self.predict_batch(X[:1])[0]
+    
+    def predict_batch(self, X: np.ndarray) -> list:
+        """Make predictions for every row of X with one predict_proba call"""
+        if self.model is None:
+            return [{
+                'error': 'Model not trained. Please train the model first.'
+            } for _ in range(len(X))]
+        
+        X = np.asarray(X, dtype=np.float32)
+        
+        # Models saved with a scaler: same result as scaler.transform,
+        # without its validation and temporaries
+        if self._inv_scale is not None:
+            X = X * self._inv_scale
+            X += self._bias
+        
+        # One predict_proba call; the predicted class is its argmax.
+        # Columns follow model.classes_, which omits levels absent from training
+        probability = self.model.predict_proba(X)
+        best_columns = probability.argmax(axis=1).tolist()
+        
+        results = []
+        for prob_row, best in zip(probability.tolist(), best_columns):
+            # Get confidence scores
+            confidence = dict.fromkeys(self.risk_levels, 0.0)
+            confidence.update(zip(self._class_levels, prob_row))
+            
+            results.append({
+                'risk_level': self._class_levels[best],
+                'risk_score': prob_row[best] * 100.0,
+                'confidence': confidence
+            })
         
-        return {
-            'risk_level': risk_level,
-            'risk_score': float(probability[0][prediction[0]] * 100),
-            'confidence': confidence
-        }
+        return results
     
     def predict_from_data(self, data: dict) -> dict:
         """Make prediction from raw data"""
         features = self.prepare_features(data)
         return self.predict(features)
     
-    def save_model(self, path: str):
-        """Save the trained model"""
+    def save_model(self, path: str, compress=('lz4', 3)):
+        """Save the trained model
+        
+        lz4 decompresses at GB/s, so loads are bound by disk rather than CPU.
+        Pass compress=0 to write an uncompressed file that load_model can mmap.
+        """
         joblib.dump({
             'model': self.model,
-            'scaler': self.scaler,
             'feature_names': self.feature_names,
             'risk_levels': self.risk_levels
-        }, path)
+        }, path, compress=compress)
     
-    def load_model(self, path: str):
-        """Load a trained model"""
-        data = joblib.load(path)
+    def load_model(self, path: str, mmap_mode: str = None):
+        """Load a trained model
+        
+        Compressed files (the save_model default) are read into memory.
+        For a file saved with compress=0, mmap_mode='r' maps its arrays
+        read-only, so worker processes share the same pages.
+        """
+        data = joblib.load(path, mmap_mode=mmap_mode)
         self.model = data['model']
-        self.scaler = data['scaler']
+        self.scaler = data.get('scaler')
         self.feature_names = data['feature_names']
         self.risk_levels = data['risk_levels']
+        self._cache_inference()
+
+
+# Synthetic risk-score cut points between Low/Medium and Medium/High
+_RISK_THRESHOLDS = np.array([25.0, 50.0], dtype=np.float32)
 
 
 def create_synthetic_training_data(n_samples: int = 1000) -> tuple:
     """Create synthetic training data based on survey patterns"""
-    np.random.seed(42)
-    
-    X = []
-    y = []
-    
-    for _ in range(n_samples):
-        # Generate random features
-        feel_sad = np.random.randint(1, 6)
-        feel_lonely = np.random.randint(1, 6)
-        feel_confident = np.random.randint(1, 6)
-        feel_stressed = np.random.randint(1, 6)
-        feel_happy = np.random.randint(1, 6)
-        feel_angry = np.random.randint(1, 6)
-        
-        hours_sleep = np.random.uniform(4, 10)
-        minutes_physical_activity = np.random.randint(0, 300)
-        
-        friends_count = np.random.randint(0, 6)
-        family_support = np.random.randint(1, 6)
-        school_belonging = np.random.randint(1, 6)
-        
-        self_harm_ever = np.random.choice([0, 1], p=[0.8, 0.2])
-        bullied_recently = np.random.choice([0, 1], p=[0.75, 0.25])
-        
-        stress_level = np.random.randint(1, 11)
-        anxiety_level = np.random.randint(1, 11)
-        
-        features = [
-            feel_sad, feel_lonely, feel_confident, feel_stressed,
-            feel_happy, feel_angry, hours_sleep, minutes_physical_activity,
-            friends_count, family_support, school_belonging,
-            self_harm_ever, bullied_recently, stress_level, anxiety_level
-        ]
-        
-        # Calculate risk label based on patterns
-        risk_score = (
-            (6 - feel_sad) * 2 +
-            (6 - feel_lonely) * 1.5 +
-            (6 - feel_confident) * 1.5 +
-            (6 - feel_stressed) * 2 +
-            (6 - feel_happy) * 2 +
-            (6 - feel_angry) * 1 +
-            max(0, 8 - hours_sleep) * 3 +
-            max(0, 60 - minutes_physical_activity) * 0.02 +
-            max(0, 3 - friends_count) * 3 +
-            max(0, 3 - family_support) * 3 +
-            max(0, 3 - school_belonging) * 2 +
-            self_harm_ever * 15 +
-            bullied_recently * 10 +
-            stress_level * 2 +
-            anxiety_level * 2
-        )
-        
-        # Determine risk level
-        if risk_score < 25:
-            label = 0  # Low
-        elif risk_score < 50:
-            label = 1  # Medium
-        else:
-            label = 2  # High
-        
-        X.append(features)
-        y.append(label)
+    rng = np.random.default_rng(42)
+    n = n_samples
+    
+    # Preallocate the feature matrix and fill it column by column,
+    # in feature_names order, instead of stacking 15 separate vectors
+    X = np.empty((n, 15), dtype=np.float32)
+    
+    # Feelings (1-5)
+    for column in range(6):
+        X[:, column] = rng.integers(1, 6, n)
+    
+    X[:, 6] = rng.uniform(4, 10, n)        # hours_sleep
+    X[:, 7] = rng.integers(0, 300, n)      # minutes_physical_activity
+    
+    X[:, 8] = rng.integers(0, 6, n)        # friends_count
+    X[:, 9] = rng.integers(1, 6, n)        # family_support
+    X[:, 10] = rng.integers(1, 6, n)       # school_belonging
+    
+    X[:, 11] = rng.choice([0, 1], size=n, p=[0.8, 0.2])    # self_harm_ever
+    X[:, 12] = rng.choice([0, 1], size=n, p=[0.75, 0.25])  # bullied_recently
+    
+    X[:, 13] = rng.integers(1, 11, n)      # stress_level
+    X[:, 14] = rng.integers(1, 11, n)      # anxiety_level
+    
+    # Calculate risk label based on patterns; temporaries are n-long, not n x 15
+    risk_score = (
+        (6 - X[:, 0]) * 2 +
+        (6 - X[:, 1]) * 1.5 +
+        (6 - X[:, 2]) * 1.5 +
+        (6 - X[:, 3]) * 2 +
+        (6 - X[:, 4]) * 2 +
+        (6 - X[:, 5]) * 1 +
+        np.maximum(0, 8 - X[:, 6]) * 3 +
+        np.maximum(0, 60 - X[:, 7]) * 0.02 +
+        np.maximum(0, 3 - X[:, 8]) * 3 +
+        np.maximum(0, 3 - X[:, 9]) * 3 +
+        np.maximum(0, 3 - X[:, 10]) * 2 +
+        X[:, 11] * 15 +
+        X[:, 12] * 10 +
+        X[:, 13] * 2 +
+        X[:, 14] * 2
+    )
+    
+    # Determine risk level: 0 = Low (< 25), 1 = Medium (< 50), 2 = High.
+    # side='right' puts scores equal to a threshold in the higher level
+    y = np.searchsorted(_RISK_THRESHOLDS, risk_score, side='right').astype(np.int8)
     
-    return np.array(X), np.array(y)
+    return X, y
 
 
 def train_model():
@@ -202,13 +231,17 @@ def train_model():
     predictor.train(X_train, y_train)
     
     # Evaluate
-    X_scaled = predictor.scaler.transform(X_test)
-    y_pred = predictor.model.predict(X_scaled)
+    y_pred = predictor.model.predict(X_test)
     
     print("\nModel Performance:")
     print(f"Accuracy: {accuracy_score(y_test, y_pred):.3f}")
     print("\nClassification Report:")
-    print(classification_report(y_test, y_pred, target_names=predictor.risk_levels))
+    print(classification_report(
+        y_test, y_pred,
+        labels=range(len(predictor.risk_levels)),
+        target_names=predictor.risk_levels,
+        zero_division=0
+    ))
     
     # Save model
     model_path = os.path.join(os.path.dirname(__file__), 'model.joblib')